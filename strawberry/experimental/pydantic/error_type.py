@@ -51,7 +51,7 @@ def error_type(
 ):
     def wrap(cls):
         model_fields = model.__fields__
-        fields_set = set(fields)
+        fields_set = frozenset(fields)
 
         cls = dataclasses.make_dataclass(
             cls.__name__,
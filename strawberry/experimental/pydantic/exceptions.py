@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 class MissingFieldsListError(Exception):
     def __init__(self, type: Type[BaseModel]):
+        self.type = type
         message = f"List of fields to copy from {type} is empty"
 
         super().__init__(message)
@@ -15,7 +16,8 @@ class UnsupportedTypeError(Exception):
 
 
 class UnregisteredTypeException(Exception):
-    def __init__(self, type: BaseModel):
+    def __init__(self, type: Type[BaseModel]):
+        self.type = type
         message = (
             f"Cannot find a Strawberry Type for {type} did you forget to register it?"
         )
@@ -3,6 +3,7 @@ from typing import Optional
 from uuid import UUID
 
 import pydantic
+from pydantic import ConstrainedInt, ConstrainedStr
 
 from .exceptions import UnsupportedTypeError
 
@@ -65,9 +66,9 @@ FIELDS_MAP = {
 
 def get_basic_type(type_):
     if isinstance(type_, type):
-        if issubclass(type_, pydantic.ConstrainedInt):
+        if issubclass(type_, ConstrainedInt):
             return int
-        if issubclass(type_, pydantic.ConstrainedStr):
+        if issubclass(type_, ConstrainedStr):
             return str
 
     if type_ in FIELDS_MAP:
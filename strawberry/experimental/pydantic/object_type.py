@@ -1,7 +1,7 @@
 import builtins
 import dataclasses
-from functools import partial
-from typing import Any, Dict, List, Optional, Tuple, Type, cast
+import itertools
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 from pydantic.fields import ModelField
@@ -11,19 +11,41 @@ from strawberry.experimental.pydantic.conversion import (
     convert_pydantic_model_to_strawberry_class,
 )
 from strawberry.experimental.pydantic.fields import get_basic_type
+from strawberry.experimental.pydantic.utils import get_strawberry_type_from_model
 from strawberry.field import StrawberryField
 from strawberry.object_type import _process_type, _wrap_dataclass
 from strawberry.private import Private
 from strawberry.types.type_resolver import _get_fields
 from strawberry.types.types import FederationTypeParams, TypeDefinition
 
-from .exceptions import MissingFieldsListError, UnregisteredTypeException
+from .exceptions import MissingFieldsListError
 
 
-def replace_pydantic_types(type_: Any):
-    if hasattr(type_, "__args__"):
+def replace_pydantic_types(
+    type_: Any, cache: Optional[Dict[int, Tuple[Any, Any]]] = None
+):
+    # cache maps id(annotation) to (annotation, result). Identity is used
+    # because Union equality ignores the order of its arguments
+    if cache is None:
+        cache = {}
+
+    cached = cache.get(id(type_))
+
+    if cached is not None and cached[0] is type_:
+        return cached[1]
+
+    new_type = _replace_pydantic_types(type_, cache)
+    cache[id(type_)] = (type_, new_type)
+
+    return new_type
+
+
+def _replace_pydantic_types(type_: Any, cache: Dict[int, Tuple[Any, Any]]):
+    args = getattr(type_, "__args__", None)
+
+    if args is not None:
         new_type = type_.copy_with(
-            tuple(replace_pydantic_types(t) for t in type_.__args__)
+            tuple(replace_pydantic_types(t, cache) for t in args)
         )
 
         if isinstance(new_type, TypeDefinition):
@@ -38,19 +60,18 @@ def replace_pydantic_types(type_: Any):
 
         return new_type
 
-    if issubclass(type_, BaseModel):
-        if hasattr(type_, "_strawberry_type"):
-            return type_._strawberry_type
-        else:
-            raise UnregisteredTypeException(type_)
+    if isinstance(type_, builtins.type) and issubclass(type_, BaseModel):
+        return get_strawberry_type_from_model(type_)
 
     return type_
 
 
-def get_type_for_field(field: ModelField):
+def get_type_for_field(
+    field: ModelField, cache: Optional[Dict[int, Tuple[Any, Any]]] = None
+):
     type_ = field.outer_type_
     type_ = get_basic_type(type_)
-    type_ = replace_pydantic_types(type_)
+    type_ = replace_pydantic_types(type_, cache)
 
     if not field.required:
         type_ = Optional[type_]
@@ -59,11 +80,15 @@ def get_type_for_field(field: ModelField):
 
 
 def _get_private_fields(cls: Type) -> List[dataclasses.Field]:
-    private_fields: List[dataclasses.Field] = []
-    for field in dataclasses.fields(cls):
-        if isinstance(field.type, Private):
-            private_fields.append(field)
-    return private_fields
+    return [
+        field for field in dataclasses.fields(cls) if isinstance(field.type, Private)
+    ]
+
+
+def _to_pydantic(self) -> Any:
+    instance_kwargs = dataclasses.asdict(self)
+
+    return self._pydantic_type(**instance_kwargs)
 
 
 def type(
@@ -76,58 +101,67 @@ def type(
     description: Optional[str] = None,
     federation: Optional[FederationTypeParams] = None,
 ):
+    # this only depends on the decorator arguments, so it is computed once
+    # even when the decorator is applied to more than one class
+    fields_set = frozenset(fields or ())
+
     def wrap(cls):
         if not fields:
             raise MissingFieldsListError(model)
 
         model_fields = model.__fields__
-        fields_set = set(fields)
-
-        all_fields: List[Tuple[str, Any, dataclasses.Field]] = [
-            (
-                name,
-                get_type_for_field(field),
-                StrawberryField(
-                    python_name=field.name,
-                    graphql_name=field.alias if field.has_alias else None,
-                    default=field.default if not field.required else UNSET,
-                    default_factory=(
-                        field.default_factory if field.default_factory else UNSET
+
+        # annotations shared between fields are only resolved once
+        replace_cache: Dict[int, Tuple[Any, Any]] = {}
+        all_fields: List[Tuple[str, Any, dataclasses.Field]] = []
+
+        for field_name, field in model_fields.items():
+            if field_name not in fields_set:
+                continue
+
+            type_annotation = get_type_for_field(field, replace_cache)
+
+            all_fields.append(
+                (
+                    field_name,
+                    type_annotation,
+                    StrawberryField(
+                        python_name=field.name,
+                        graphql_name=field.alias if field.has_alias else None,
+                        default=field.default if not field.required else UNSET,
+                        default_factory=(
+                            field.default_factory if field.default_factory else UNSET
+                        ),
+                        type_annotation=type_annotation,
                     ),
-                    type_annotation=get_type_for_field(field),
-                ),
+                )
             )
-            for name, field in model_fields.items()
-            if name in fields_set
-        ]
 
         wrapped = _wrap_dataclass(cls)
-        extra_fields = cast(List[dataclasses.Field], _get_fields(wrapped))
-        private_fields = _get_private_fields(wrapped)
 
-        all_fields.extend(
-            (
+        # classes that only declare the pydantic fields (usually with an empty
+        # body) have no extra or private fields to collect
+        if dataclasses.fields(wrapped):
+            extra_fields = _get_fields(wrapped)
+            private_fields = _get_private_fields(wrapped)
+
+            all_fields.extend(
                 (
-                    field.name,
-                    field.type,
-                    field,
+                    (
+                        field.name,
+                        field.type,
+                        field,
+                    )
+                    for field in itertools.chain(extra_fields, private_fields)
                 )
-                for field in extra_fields + private_fields
             )
-        )
 
         # Sort fields so that fields with missing defaults go first
         # because dataclasses require that fields with no defaults are defined
-        # first
-        missing_default = []
-        has_default = []
-        for field in all_fields:
-            if field[2].default is dataclasses.MISSING:
-                missing_default.append(field)
-            else:
-                has_default.append(field)
-
-        sorted_fields = missing_default + has_default
+        # first. The sort is stable, so the order is otherwise unchanged
+        sorted_fields = sorted(
+            all_fields, key=lambda field: field[2].default is not dataclasses.MISSING
+        )
 
         cls = dataclasses.make_dataclass(
             cls.__name__,
@@ -145,22 +179,36 @@ def type(
 
         model._strawberry_type = cls  # type: ignore
 
+        cls._pydantic_type = model
+
         def from_pydantic(instance: Any, extra: Dict[str, Any] = None) -> Any:
             return convert_pydantic_model_to_strawberry_class(
                 cls=cls, model_instance=instance, extra=extra
             )
 
-        def to_pydantic(self) -> Any:
-            instance_kwargs = dataclasses.asdict(self)
-
-            return model(**instance_kwargs)
-
         cls.from_pydantic = staticmethod(from_pydantic)
-        cls.to_pydantic = to_pydantic
+        cls.to_pydantic = _to_pydantic
 
         return cls
 
     return wrap
 
 
-input = partial(type, is_input=True)
+def input(
+    model: Type[BaseModel],
+    *,
+    fields: List[str],
+    name: Optional[str] = None,
+    is_interface: bool = False,
+    description: Optional[str] = None,
+    federation: Optional[FederationTypeParams] = None,
+):
+    return type(
+        model=model,
+        fields=fields,
+        name=name,
+        is_input=True,
+        is_interface=is_interface,
+        description=description,
+        federation=federation,
+    )
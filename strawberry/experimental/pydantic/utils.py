@@ -19,8 +19,13 @@ def normalize_type(type_) -> Any:
     return type_
 
 
+_MISSING = object()
+
+
 def get_strawberry_type_from_model(type_: Any):
-    if hasattr(type_, "_strawberry_type"):
-        return type_._strawberry_type
-    else:
+    strawberry_type = getattr(type_, "_strawberry_type", _MISSING)
+
+    if strawberry_type is _MISSING:
         raise UnregisteredTypeException(type_)
+
+    return strawberry_type
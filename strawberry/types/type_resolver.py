@@ -68,12 +68,18 @@ def _get_fields(cls: Type) -> List[StrawberryField]:
     # Find the class the each field was originally defined on so we can use
     # that scope later when resolving the type, as it may have different names
     # available to it.
-    origins: Dict[str, type] = {field_name: cls for field_name in cls.__annotations__}
+    # Annotations are read from each class' own __dict__, so a class without
+    # annotations of its own doesn't claim the ones inherited from its parents.
+    origins: Dict[str, type] = {
+        field_name: cls for field_name in cls.__dict__.get("__annotations__", {})
+    }
 
     for base in cls.__mro__:
         if hasattr(base, "_type_definition"):
+            base_annotations = base.__dict__.get("__annotations__", {})
+
             for field in base._type_definition._fields:  # type: ignore
-                if field.python_name in base.__annotations__:
+                if field.python_name in base_annotations:
                     origins.setdefault(field.name, base)
 
     # then we can proceed with finding the fields for the current class
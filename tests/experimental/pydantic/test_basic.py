@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import pytest
 
@@ -8,6 +8,7 @@ import strawberry
 from strawberry.experimental.pydantic.exceptions import MissingFieldsListError
 from strawberry.type import StrawberryList, StrawberryOptional
 from strawberry.types.types import TypeDefinition
+from strawberry.union import StrawberryUnion
 
 
 def test_basic_type():
@@ -46,7 +47,7 @@ def test_referencing_other_models_fails_when_not_registered():
     with pytest.raises(
         strawberry.experimental.pydantic.UnregisteredTypeException,
         match=("Cannot find a Strawberry Type for (.*) did you forget to register it?"),
-    ):
+    ) as exc_info:
 
         @strawberry.experimental.pydantic.type(
             User, fields=["age", "password", "group"]
@@ -54,6 +55,14 @@ def test_referencing_other_models_fails_when_not_registered():
         class UserType:
             pass
 
+    message = (
+        f"Cannot find a Strawberry Type for {Group} did you forget to register it?"
+    )
+
+    assert str(exc_info.value) == message
+    assert exc_info.value.args == (message,)
+    assert exc_info.value.type is Group
+
 
 def test_referencing_other_registered_models():
     class Group(pydantic.BaseModel):
@@ -83,6 +92,70 @@ def test_referencing_other_registered_models():
     assert field2.type is GroupType
 
 
+def test_referencing_models_registered_again():
+    class Group(pydantic.BaseModel):
+        name: str
+
+    class User(pydantic.BaseModel):
+        group: Optional[Group]
+
+    @strawberry.experimental.pydantic.type(Group, fields=["name"])
+    class GroupType:
+        pass
+
+    @strawberry.experimental.pydantic.type(User, fields=["group"])
+    class UserType:
+        pass
+
+    @strawberry.experimental.pydantic.type(Group, fields=["name"])
+    class OtherGroupType:
+        pass
+
+    @strawberry.experimental.pydantic.type(User, fields=["group"])
+    class OtherUserType:
+        pass
+
+    [field] = UserType._type_definition.fields
+    assert isinstance(field.type, StrawberryOptional)
+    assert field.type.of_type is GroupType
+
+    [field] = OtherUserType._type_definition.fields
+    assert isinstance(field.type, StrawberryOptional)
+    assert field.type.of_type is OtherGroupType
+
+
+def test_unions_with_the_same_types_in_a_different_order():
+    class A(pydantic.BaseModel):
+        a: int
+
+    class B(pydantic.BaseModel):
+        b: int
+
+    class Model(pydantic.BaseModel):
+        first: Union[A, B]
+        second: Union[B, A]
+
+    @strawberry.experimental.pydantic.type(A, fields=["a"])
+    class AType:
+        pass
+
+    @strawberry.experimental.pydantic.type(B, fields=["b"])
+    class BType:
+        pass
+
+    @strawberry.experimental.pydantic.type(Model, fields=["first", "second"])
+    class ModelType:
+        pass
+
+    [field1, field2] = ModelType._type_definition.fields
+
+    assert isinstance(field1.type, StrawberryUnion)
+    assert field1.type.types == (AType, BType)
+
+    assert isinstance(field2.type, StrawberryUnion)
+    assert field2.type.types == (BType, AType)
+
+
 def test_list():
     class User(pydantic.BaseModel):
         friend_names: List[str]
@@ -133,7 +206,7 @@ def test_basic_type_without_fields_throws_an_error():
         age: int
         password: Optional[str]
 
-    with pytest.raises(MissingFieldsListError):
+    with pytest.raises(MissingFieldsListError) as exc_info:
 
         @strawberry.experimental.pydantic.type(
             User,
@@ -142,6 +215,12 @@ def test_basic_type_without_fields_throws_an_error():
         class UserType:
             pass
 
+    message = f"List of fields to copy from {User} is empty"
+
+    assert str(exc_info.value) == message
+    assert exc_info.value.args == (message,)
+    assert exc_info.value.type is User
+
 
 def test_type_with_fields_coming_from_strawberry_and_pydantic():
     class User(pydantic.BaseModel):
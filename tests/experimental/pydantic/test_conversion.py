@@ -391,3 +391,25 @@ def test_can_convert_input_types_to_pydantic_default_values():
 
     assert user.age == 1
     assert user.password is None
+
+
+def test_can_convert_nested_input_types_to_pydantic():
+    class Work(pydantic.BaseModel):
+        name: str
+
+    class User(pydantic.BaseModel):
+        age: int
+        works: List[Work]
+
+    @strawberry.experimental.pydantic.input(Work, fields=["name"])
+    class WorkInput:
+        pass
+
+    @strawberry.experimental.pydantic.input(User, fields=["age", "works"])
+    class UserInput:
+        pass
+
+    data = UserInput(1, [WorkInput("Software"), WorkInput("Music")])
+    user = data.to_pydantic()
+
+    assert user == User(age=1, works=[Work(name="Software"), Work(name="Music")])
@@ -192,3 +192,21 @@ def test_field_nodes_deprecation():
 
     assert not result.errors
     assert result.data["field"] == 0
+
+
+def test_field_nodes_deprecation_points_to_the_resolver():
+    def resolver(info):
+        info.field_nodes
+        return 0
+
+    @strawberry.type
+    class Query:
+        field: int = strawberry.field(resolver=resolver)
+
+    schema = strawberry.Schema(query=Query)
+
+    with pytest.warns(DeprecationWarning) as record:
+        result = schema.execute_sync("{ field }")
+
+    assert not result.errors
+    assert record[0].filename == __file__
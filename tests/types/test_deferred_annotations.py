@@ -36,3 +36,22 @@ def test_deferred_other_module():
         assert definition.fields[0].type == mod.User
     finally:
         del modules[mod.__name__]
+
+
+def test_deferred_other_module_subclass_without_annotations():
+    mod = ModuleType("tests.deferred_module")
+    modules[mod.__name__] = mod
+
+    try:
+        exec(deferred_module_source, mod.__dict__)
+
+        # User is only available in the module UserContent is defined in
+        @strawberry.type
+        class Post(mod.UserContent):
+            pass
+
+        definition = Post._type_definition
+        assert definition.fields[0].python_name == "created_by"
+        assert definition.fields[0].type == mod.User
+    finally:
+        del modules[mod.__name__]